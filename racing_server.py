@@ -1,26 +1,32 @@
 #!/usr/bin/env python3
 """
 Analog Racing Controller Server - FIXED VERSION
-- 60 FPS update rate
+- 60 FPS client updates, device writes capped at 250 Hz (OS timer permitting)
 - Multi-rotation steering (900°+ like real wheels)
 - Fixed angle wraparound bug
 """
 
 import asyncio
+import contextlib
 import websockets
+from websockets.datastructures import Headers
+from websockets.http11 import Response
 import json
-import time
-import threading
+import gzip
+import struct
+import http
 from typing import Dict, Any
 import logging
 import socket
-import http.server
-import socketserver
 import os
+import stat
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# serve_page uses the process_request(connection, request) hook of the asyncio server that became default in 14.0
+WEBSOCKETS_OK = int(websockets.__version__.split('.')[0]) >= 14
+
 try:
     import vgamepad as vg
     VGAMEPAD_AVAILABLE = True
@@ -41,24 +47,101 @@ try:
 except ImportError:
     PYAUTOGUI_AVAILABLE = False
 
+try:
+    import pydirectinput
+    PYDIRECTINPUT_AVAILABLE = True
+except (ImportError, AttributeError, OSError):
+    # pydirectinput touches ctypes.windll at import time, which fails outside Windows
+    PYDIRECTINPUT_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only catch the latter
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Keyboard fallback keys, KEYBOARD_KEYS[i] is held while bit 1 << i is set
+KEY_A, KEY_D, KEY_W, KEY_S, KEY_SPACE, KEY_H = 1, 2, 4, 8, 16, 32
+KEYBOARD_KEYS = ('a', 'd', 'w', 's', 'space', 'h')
+
+# Binary protocol, one fixed little-endian record per command (a frame may batch several):
+#   u8 command | u8 button flags | 2 pad | f32 steering (°) | f32 accelerator (%) | f32 brake (%)
+BINARY_FRAME = struct.Struct('<BBxxfff')
+# Command codes: 0 update, 1-4 button edges (below), 5 reset
+CMD_UPDATE, CMD_RESET = 0, 5
+FLAG_HANDBRAKE, FLAG_HORN = 1, 2
+# Button edges in binary frames, code -> (flag bit, pressed)
+BINARY_BUTTON_EDGES = {
+    1: (FLAG_HANDBRAKE, True),
+    2: (FLAG_HANDBRAKE, False),
+    3: (FLAG_HORN, True),
+    4: (FLAG_HORN, False),
+}
+_EMPTY = {}  # Shared stand-in for a missing payload, never mutated
+
+def _keyboard_mask(steering, accelerator, brake, handbrake, horn):
+    return ((KEY_A if steering < -10 else 0) |
+            (KEY_D if steering > 10 else 0) |
+            (KEY_W if accelerator > 0.1 else 0) |
+            (KEY_S if brake > 0.1 else 0) |
+            (KEY_SPACE if handbrake else 0) |
+            (KEY_H if horn else 0))
+
 class AnalogRacingServer:
-    def __init__(self, host='0.0.0.0', port=8765):
+    __slots__ = (
+        'host', 'port', 'unix_path', 'connected_clients',
+        'current_steering', 'max_steering_angle', '_inv_max_steer',
+        'current_accelerator', 'current_brake', 'handbrake_pressed', 'horn_pressed',
+        'controller', 'controller_type', '_dirty', '_last_key', '_prev_mask', '_local_ip',
+        '_btn_a', '_btn_x', '_press', '_release', '_ljs', '_rt', '_lt', '_upd',
+        '_key_down', '_key_up', '_cmd_dispatch', 'update_hz', '_tick',
+        '_client_flags',
+    )
+
+    def __init__(self, host='0.0.0.0', port=8765, unix_path=None, update_hz=250):
         self.host = host
         self.port = port
+        self.unix_path = unix_path  # Extra listener for a local reverse proxy, TCP stays up for phones
+        self.update_hz = update_hz  # Device write cap, games poll at 125-250 Hz so more is wasted driver calls
+        self._tick = 1 / update_hz
         self.connected_clients = set()
+        self._client_flags = {}  # websocket -> FLAG_* bits that client holds, the device sees their union
         
         # CHANGED: Support full rotation range
         self.current_steering = 0.0  # Now supports -900 to +900 degrees
         self.max_steering_angle = 900.0  # Configurable max rotation
+        self._inv_max_steer = 1.0 / self.max_steering_angle  # Multiply instead of divide per tick
         
         self.current_accelerator = 0.0
         self.current_brake = 0.0
         self.handbrake_pressed = False
         self.horn_pressed = False
+        self._dirty = asyncio.Event()  # Set when input changed since the last controller flush
+        self._last_key = None  # Last quantized state submitted to vgamepad
+        self._prev_mask = 0  # Keyboard fallback keys currently held down
+        self._local_ip = None  # Cached result of the get_local_ip probe
 
         self.controller = None
         self.controller_type = self.init_controller()
 
+        self._cmd_dispatch = {
+            'update': self._cmd_update,
+            'handbrake_press': self._cmd_hb_press,
+            'handbrake_release': self._cmd_hb_release,
+            'horn_press': self._cmd_horn_press,
+            'horn_release': self._cmd_horn_release,
+            'reset': self._cmd_reset,
+        }
+
         logger.info(f"Server initialized on {host}:{port}")
         logger.info(f"Controller: {self.controller_type}")
         logger.info(f"Steering range: ±{self.max_steering_angle}°")
@@ -67,6 +150,15 @@ class AnalogRacingServer:
         if VGAMEPAD_AVAILABLE:
             try:
                 self.controller = vg.VX360Gamepad()
+                # Pre-bind what update_vgamepad_controller uses on every tick
+                self._btn_a = vg.XUSB_BUTTON.XUSB_GAMEPAD_A
+                self._btn_x = vg.XUSB_BUTTON.XUSB_GAMEPAD_X
+                self._press = self.controller.press_button
+                self._release = self.controller.release_button
+                self._ljs = self.controller.left_joystick
+                self._rt = self.controller.right_trigger
+                self._lt = self.controller.left_trigger
+                self._upd = self.controller.update
                 logger.info("🎮 vgamepad Xbox controller initialized")
                 return "VGAMEPAD_XBOX"
             except Exception as e:
@@ -80,11 +172,14 @@ class AnalogRacingServer:
             except Exception as e:
                 logger.error(f"VJoy failed: {e}")
 
-        if PYAUTOGUI_AVAILABLE:
-            pyautogui.FAILSAFE = True
-            pyautogui.PAUSE = 0
-            self.keys_pressed = set()
-            logger.info("⌨️ Keyboard fallback initialized")
+        if PYDIRECTINPUT_AVAILABLE or PYAUTOGUI_AVAILABLE:
+            # Prefer pydirectinput: it sends scancodes directly, which DirectInput games also see
+            keyboard = pydirectinput if PYDIRECTINPUT_AVAILABLE else pyautogui
+            keyboard.FAILSAFE = True
+            keyboard.PAUSE = 0
+            self._key_down = keyboard.keyDown
+            self._key_up = keyboard.keyUp
+            logger.info(f"⌨️ Keyboard fallback initialized ({keyboard.__name__})")
             return "KEYBOARD"
 
         return "NONE"
@@ -100,30 +195,41 @@ class AnalogRacingServer:
     def update_vgamepad_controller(self):
         try:
             # CHANGED: Normalize steering from full range to -1.0 to 1.0
-            steering_normalized = max(-1.0, min(1.0, self.current_steering / self.max_steering_angle))
-            self.controller.left_joystick_float(x_value_float=steering_normalized, y_value_float=0.0)
+            s = self.current_steering * self._inv_max_steer
+            steering_normalized = -1.0 if s < -1.0 else (1.0 if s > 1.0 else s)
+            
+            # Quantize to the report resolution and skip the submit if nothing changed
+            steering = int(steering_normalized * 32767)
+            accelerator = int(self.current_accelerator * 255)
+            brake = int(self.current_brake * 255)
+            key = (steering, accelerator, brake, self.handbrake_pressed, self.horn_pressed)
+            if key == self._last_key:
+                return
             
-            self.controller.right_trigger_float(value_float=self.current_accelerator)
-            self.controller.left_trigger_float(value_float=self.current_brake)
+            self._ljs(x_value=steering, y_value=0)
+            self._rt(value=accelerator)
+            self._lt(value=brake)
 
             if self.handbrake_pressed:
-                self.controller.press_button(button=vg.XUSB_BUTTON.XUSB_GAMEPAD_A)
+                self._press(button=self._btn_a)
             else:
-                self.controller.release_button(button=vg.XUSB_BUTTON.XUSB_GAMEPAD_A)
+                self._release(button=self._btn_a)
 
             if self.horn_pressed:
-                self.controller.press_button(button=vg.XUSB_BUTTON.XUSB_GAMEPAD_X)
+                self._press(button=self._btn_x)
             else:
-                self.controller.release_button(button=vg.XUSB_BUTTON.XUSB_GAMEPAD_X)
+                self._release(button=self._btn_x)
             
-            self.controller.update()
+            self._upd()
+            self._last_key = key
 
         except Exception as e:
             logger.error(f"vgamepad error: {e}")
 
     def update_vjoy_controller(self):
         try:
-            steering_normalized = max(-1.0, min(1.0, self.current_steering / self.max_steering_angle))
+            s = self.current_steering * self._inv_max_steer
+            steering_normalized = -1.0 if s < -1.0 else (1.0 if s > 1.0 else s)
             steering_vjoy = int((steering_normalized + 1.0) / 2.0 * 32767) + 1
             self.controller.set_axis(pyvjoy.HID_USAGE_X, steering_vjoy)
             
@@ -140,55 +246,24 @@ class AnalogRacingServer:
             logger.error(f"VJoy error: {e}")
 
     def update_keyboard_controller(self):
-        try:
-            if abs(self.current_steering) < 10:
-                self.release_key('a')
-                self.release_key('d')
-            elif self.current_steering < -10:
-                self.release_key('d')
-                self.press_key('a')
-            elif self.current_steering > 10:
-                self.release_key('a')
-                self.press_key('d')
-            
-            if self.current_accelerator > 0.1:
-                self.press_key('w')
-            else:
-                self.release_key('w')
-            
-            if self.current_brake > 0.1:
-                self.press_key('s')
-            else:
-                self.release_key('s')
-            
-            if self.handbrake_pressed:
-                self.press_key('space')
-            else:
-                self.release_key('space')
-            
-            if self.horn_pressed:
-                self.press_key('h')
-            else:
-                self.release_key('h')
-                
-        except Exception as e:
-            logger.error(f"Keyboard error: {e}")
-
-    def press_key(self, key):
-        if key not in self.keys_pressed:
+        self.apply_key_mask(_keyboard_mask(self.current_steering, self.current_accelerator,
+                                           self.current_brake, self.handbrake_pressed, self.horn_pressed))
+
+    def apply_key_mask(self, desired):
+        # Only send keyDown/keyUp for the bits that differ from the held keys
+        changed = desired ^ self._prev_mask
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            key = KEYBOARD_KEYS[bit.bit_length() - 1]
             try:
-                pyautogui.keyDown(key)
-                self.keys_pressed.add(key)
+                if desired & bit:
+                    self._key_down(key)
+                else:
+                    self._key_up(key)
+                self._prev_mask ^= bit
             except Exception as e:
-                logger.error(f"Error pressing {key}: {e}")
-
-    def release_key(self, key):
-        if key in self.keys_pressed:
-            try:
-                pyautogui.keyUp(key)
-                self.keys_pressed.discard(key)
-            except Exception as e:
-                logger.error(f"Error releasing {key}: {e}")
+                logger.error(f"Error {'pressing' if desired & bit else 'releasing'} {key}: {e}")
 
     def release_all_inputs(self):
         self.current_steering = 0.0
@@ -196,19 +271,27 @@ class AnalogRacingServer:
         self.current_brake = 0.0
         self.handbrake_pressed = False
         self.horn_pressed = False
+        self._client_flags.clear()
         
+        self._dirty.clear()
+        
+        # Submit the neutral state exactly once per backend
         if self.controller_type == "KEYBOARD":
-            for key in list(getattr(self, 'keys_pressed', set())):
-                self.release_key(key)
+            self.apply_key_mask(0)
         elif self.controller_type == "VGAMEPAD_XBOX":
-            self.controller.reset()
-            self.controller.update()
-        
-        self.update_controller()
+            try:
+                self.controller.reset()
+                self.controller.update()
+                self._last_key = (0, 0, 0, False, False)
+            except Exception as e:
+                logger.error(f"vgamepad error: {e}")
+        else:
+            self.update_controller()
 
     async def register_client(self, websocket):
         self.connected_clients.add(websocket)
-        client_ip = websocket.remote_address[0]
+        # Unix socket peers have no (host, port) pair
+        client_ip = websocket.remote_address[0] if websocket.remote_address else self.unix_path
         logger.info(f"Client connected: {client_ip}. Total: {len(self.connected_clients)}")
 
     async def unregister_client(self, websocket):
@@ -217,51 +300,99 @@ class AnalogRacingServer:
         
         if not self.connected_clients:
             self.release_all_inputs()
+        elif self._client_flags.pop(websocket, 0):
+            self._apply_client_flags()
 
     async def handle_message(self, websocket, message):
         try:
-            data = json.loads(message)
-            command = data.get('command')
-            payload = data.get('data', {})
+            # Binary frames use the fixed layout; JSON (text or bytes, object or array) is kept for legacy clients
+            if isinstance(message, (bytes, bytearray)) and message[:1] not in (b'{', b'['):
+                self.handle_binary_message(websocket, message)
+                return
             
-            if command == 'update':
-                # CHANGED: Now accepts full rotation range in degrees
-                if 'steering' in payload:
-                    self.current_steering = max(-self.max_steering_angle, 
-                                               min(self.max_steering_angle, payload['steering']))
-                    
-                if 'accelerator' in payload:
-                    self.current_accelerator = max(0.0, min(1.0, payload['accelerator'] / 100.0))
-                    
-                if 'brake' in payload:
-                    self.current_brake = max(0.0, min(1.0, payload['brake'] / 100.0))
-                
-                self.update_controller()
-                    
-            elif command == 'handbrake_press':
-                self.handbrake_pressed = True
-                self.update_controller()
-                
-            elif command == 'handbrake_release':
-                self.handbrake_pressed = False
-                self.update_controller()
-                
-            elif command == 'horn_press':
-                self.horn_pressed = True
-                self.update_controller()
-                
-            elif command == 'horn_release':
-                self.horn_pressed = False
-                self.update_controller()
-                
-            elif command == 'reset':
-                self.release_all_inputs()
+            data = json_loads(message)
+            for item in (data if isinstance(data, list) else (data,)):
+                handler = self._cmd_dispatch.get(item.get('command'))
+                if handler:
+                    handler(websocket, item.get('data') or _EMPTY)
                 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON: {e}")
         except Exception as e:
             logger.error(f"Error handling message: {e}")
 
+    def handle_binary_message(self, websocket, message):
+        client_flags = self._client_flags
+        for code, flags, steering, accelerator, brake in BINARY_FRAME.iter_unpack(message):
+            if code == CMD_UPDATE:
+                # Update records also carry the sender's buttons, so a lost release heals itself
+                # without touching buttons another client is holding
+                client_flags[websocket] = flags
+                self._apply_client_flags()
+                self.set_inputs(steering, accelerator, brake)
+                continue
+            
+            edge = BINARY_BUTTON_EDGES.get(code)
+            if edge:
+                self._set_client_button(websocket, *edge)
+            elif code == CMD_RESET:
+                self.release_all_inputs()
+
+    def _set_client_button(self, websocket, bit, pressed):
+        held = self._client_flags.get(websocket, 0)
+        self._client_flags[websocket] = held | bit if pressed else held & ~bit
+        self._apply_client_flags()
+
+    def _apply_client_flags(self):
+        held = 0
+        for flags in self._client_flags.values():
+            held |= flags
+        self.handbrake_pressed = bool(held & FLAG_HANDBRAKE)
+        self.horn_pressed = bool(held & FLAG_HORN)
+        self._dirty.set()
+
+    def set_inputs(self, steering, accelerator, brake):
+        # CHANGED: Now accepts full rotation range in degrees
+        if steering is not None:
+            self.current_steering = max(-self.max_steering_angle, 
+                                       min(self.max_steering_angle, float(steering)))
+            
+        if accelerator is not None:
+            self.current_accelerator = max(0.0, min(1.0, accelerator / 100.0))
+            
+        if brake is not None:
+            self.current_brake = max(0.0, min(1.0, brake / 100.0))
+        
+        self._dirty.set()
+
+    # JSON command handlers; buttons go through the same per-client flags as binary clients
+    def _cmd_update(self, websocket, payload):
+        self.set_inputs(payload.get('steering'), payload.get('accelerator'), payload.get('brake'))
+
+    def _cmd_hb_press(self, websocket, payload):
+        self._set_client_button(websocket, FLAG_HANDBRAKE, True)
+
+    def _cmd_hb_release(self, websocket, payload):
+        self._set_client_button(websocket, FLAG_HANDBRAKE, False)
+
+    def _cmd_horn_press(self, websocket, payload):
+        self._set_client_button(websocket, FLAG_HORN, True)
+
+    def _cmd_horn_release(self, websocket, payload):
+        self._set_client_button(websocket, FLAG_HORN, False)
+
+    def _cmd_reset(self, websocket, payload):
+        self.release_all_inputs()
+
+    async def _flush_loop(self):
+        # The single device writer: the current_* fields hold only the newest input from any client,
+        # pushed when they change and at most once per tick
+        while True:
+            await self._dirty.wait()
+            self._dirty.clear()
+            self.update_controller()
+            await asyncio.sleep(self._tick)
+
     async def handle_client(self, websocket):
         await self.register_client(websocket)
         
@@ -276,10 +407,13 @@ class AnalogRacingServer:
             await self.unregister_client(websocket)
 
     def get_local_ip(self):
+        if self._local_ip is not None:
+            return self._local_ip
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
                 s.connect(("8.8.8.8", 80))
-                return s.getsockname()[0]
+                self._local_ip = s.getsockname()[0]
+                return self._local_ip
         except Exception:
             return "127.0.0.1"
 
@@ -290,61 +424,105 @@ class AnalogRacingServer:
         print("=" * 70)
         print(f"🖥️  Server: {local_ip}:{self.port}")
         print(f"🔗 WebSocket: ws://{local_ip}:{self.port}")
-        print(f"📱 Web Interface: http://{local_ip}:8000")
+        print(f"📱 Web Interface: http://{local_ip}:{self.port}")
+        if self.unix_path:
+            print(f"🔌 Unix socket: {self.unix_path}")
         print()
         print("🎮 CONTROLLER:", self.controller_type)
         print(f"🎯 Steering Range: ±{self.max_steering_angle}° (multi-rotation)")
-        print("⚡ Update Rate: 60 FPS (16.67ms)")
+        # asyncio.sleep() is bound by the OS timer; Windows' default ~15.6ms tick holds the writer near 64 Hz
+        print(f"⚡ Device Update Cap: {self.update_hz} Hz (actual rate limited by the OS timer, ~64 Hz on Windows)")
         print("🐛 Bug Fixes: Angle wraparound fixed, smooth rotation")
         print()
         print("Press Ctrl+C to stop")
         print("=" * 70)
 
+    def serve_page(self, connection, request):
+        # Answer plain HTTP GETs for the page on the WebSocket port; upgrades fall through
+        if request.headers.get('Upgrade', '').lower() == 'websocket':
+            return None
+        if request.path.split('?', 1)[0] not in ('/', '/index.html'):
+            return connection.respond(http.HTTPStatus.NOT_FOUND, "Not Found\n")
+        
+        # The body depends on Accept-Encoding, so caches in front (e.g. a reverse proxy) must key on it
+        headers = Headers([('Content-Type', 'text/html; charset=utf-8'), ('Vary', 'Accept-Encoding')])
+        body = _HTML_BYTES
+        if _accepts_gzip(request.headers.get('Accept-Encoding', '')):
+            headers['Content-Encoding'] = 'gzip'
+            body = _HTML_GZ
+        headers['Content-Length'] = str(len(body))
+        return Response(http.HTTPStatus.OK, 'OK', headers, body)
+
+    @staticmethod
+    def _remove_stale_socket(path):
+        # A socket file left by an unclean exit would make the bind fail; never delete anything else
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise FileExistsError(f"{path} exists and is not a socket")
+        os.unlink(path)
+
+    @staticmethod
+    def _remove_socket_file(path):
+        # Shutdown cleanup; the file may already be gone (removed by hand or by a tmp cleaner)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
     async def start_server(self):
         self.print_connection_info()
+        # Recreate the event on the running loop: before 3.10 an Event binds to the loop current at
+        # construction, which is not the one asyncio.run()/uvloop.run() starts
+        self._dirty = asyncio.Event()
+        flush_task = asyncio.create_task(self._flush_loop())
+        
+        options = dict(
+            process_request=self.serve_page,
+            ping_interval=20,
+            ping_timeout=10,
+            compression=None,  # Frames are tiny, deflate costs more than it saves
+            max_size=4096,
+            max_queue=16
+        )
         
         try:
-            async with websockets.serve(
-                self.handle_client,
-                self.host,
-                self.port,
-                ping_interval=20,
-                ping_timeout=10
-            ):
+            async with contextlib.AsyncExitStack() as stack:
+                await stack.enter_async_context(
+                    websockets.serve(self.handle_client, self.host, self.port, **options))
+                if self.unix_path and hasattr(socket, 'AF_UNIX'):
+                    self._remove_stale_socket(self.unix_path)
+                    await stack.enter_async_context(
+                        websockets.unix_serve(self.handle_client, self.unix_path, **options))
+                    stack.callback(self._remove_socket_file, self.unix_path)
+                elif self.unix_path:
+                    logger.warning("⚠️ Unix sockets are not supported on this platform")
                 await asyncio.Future()
         except KeyboardInterrupt:
             logger.info("Server shutdown")
         except Exception as e:
             logger.error(f"Server error: {e}")
         finally:
+            flush_task.cancel()
             self.release_all_inputs()
 
-class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-    def end_headers(self):
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
-        super().end_headers()
-    
-    def log_message(self, format, *args):
-        pass
-
-def create_html_server():
-    def run_http_server():
-        PORT = 8000
-        Handler = CustomHTTPRequestHandler
-        
-        try:
-            with socketserver.TCPServer(("", PORT), Handler) as httpd:
-                httpd.serve_forever()
-        except Exception as e:
-            pass
-    
-    http_thread = threading.Thread(target=run_http_server, daemon=True)
-    http_thread.start()
-    return http_thread
-
-def create_html_file():
+def _accepts_gzip(accept_encoding):
+    # True if gzip is listed without q=0, e.g. 'gzip, deflate' but not 'gzip;q=0'
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.partition(';')
+        if name.strip().lower() != 'gzip':
+            continue
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+def _build_html():
     html_content = '''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -439,12 +617,22 @@ def create_html_file():
     </div>
 
     <script>
-        const serverIP = window.location.hostname || 'localhost';
-        const wsUrl = `ws://${serverIP}:8765`;
+        // The page is served by the WebSocket server itself, so connect back to the same host and port
+        // Pages served over https (e.g. through a TLS-terminating proxy) must use wss to avoid mixed content
+        const wsUrl = `${window.location.protocol === 'https:' ? 'wss' : 'ws'}://${window.location.host || 'localhost:8765'}`;
+
+        // Must match BINARY_FRAME, CMD_UPDATE / BINARY_BUTTON_EDGES / CMD_RESET on the server
+        const COMMAND_CODES = { update: 0, handbrake_press: 1, handbrake_release: 2, horn_press: 3, horn_release: 4, reset: 5 };
+        const FLAG_HANDBRAKE = 1, FLAG_HORN = 2;
+        const RECORD_SIZE = 16;
+        // Smallest pedal change worth sending: one step of the 15-bit vJoy axis (finer than the 8-bit Xbox triggers)
+        const PEDAL_STEP = 100 / 32767;
+        const HEARTBEAT_MS = 500;
 
         class AnalogRacingController {
             constructor() {
                 this.ws = null;
+                this._backoff = 100; // Reconnect delay in ms, doubles up to 3 s
                 // CHANGED: Track cumulative rotation without limits initially
                 this.cumulativeAngle = 0;
                 this.maxRotation = 900; // Can be adjusted (450, 900, 1080, etc.)
@@ -452,14 +640,34 @@ def create_html_file():
                 
                 this.acceleratorValue = 0;
                 this.brakeValue = 0;
-                this.isHandbrakePressed = false;
+                this.buttonFlags = 0; // FLAG_* bits of the buttons held down
                 this.steeringAnimation = null;
+                this._cur = new Float32Array(3); // [steering, accelerator, brake] right now
+                this._prev = new Float32Array(3); // ...and as last sent
+                this._thresh = new Float32Array([this.maxRotation / 32767, PEDAL_STEP, PEDAL_STEP]); // One axis step each
+                this._force = true; // Send the next update even if nothing moved
+                this._dirty = false;
+                this._rafHandle = 0;
+                this._outbox = []; // Records queued for the next frame flush
+                
+                // Look up the elements the per-frame UI updates touch once
+                const $ = (id) => document.getElementById(id);
+                this.el = {
+                    status: $('connectionStatus'), wsDbg: $('debugWebSocket'),
+                    wheel: $('steeringWheel'), sVal: $('steeringValue'), sDbg: $('debugSteering'),
+                    aFill: $('acceleratorFill'), aVal: $('acceleratorValue'), aDbg: $('debugAccelerator'),
+                    bFill: $('brakeFill'), bVal: $('brakeValue'), bDbg: $('debugBrake')
+                };
+                // Rounded values currently shown, so unchanged labels are not rewritten
+                this._lastSteerInt = null;
+                this._lastAccInt = null;
+                this._lastBrkInt = null;
                 
                 this.setupWebSocket();
                 this.setupSteeringWheel();
                 this.setupPedals();
                 this.setupControls();
-                this.startUpdateLoop();
+                this.startHeartbeat();
                 this.preventRefresh();
             }
 
@@ -470,28 +678,30 @@ def create_html_file():
 
             setupWebSocket() {
                 this.connectWebSocket();
-                setInterval(() => {
-                    if (!this.ws || this.ws.readyState === WebSocket.CLOSED) {
-                        this.connectWebSocket();
-                    }
-                }, 3000);
             }
 
             connectWebSocket() {
                 try {
                     this.ws = new WebSocket(wsUrl);
-                    this.ws.onopen = () => { this.updateConnectionStatus(true); this.vibrate(); };
-                    this.ws.onclose = () => { this.updateConnectionStatus(false); };
+                    this.ws.onopen = () => { this._backoff = 100; this._force = this.isActive(); this.scheduleSend(); this.updateConnectionStatus(true); this.vibrate(); };
+                    this.ws.onclose = () => { this.updateConnectionStatus(false); this.scheduleReconnect(); };
                     this.ws.onerror = (error) => { console.error('WebSocket error:', error); this.updateConnectionStatus(false); };
                 } catch (error) {
                     console.error('WebSocket creation failed:', error);
                     this.updateConnectionStatus(false);
+                    this.scheduleReconnect();
                 }
             }
 
+            // Reconnect from onclose with exponential backoff instead of polling readyState
+            scheduleReconnect() {
+                setTimeout(() => this.connectWebSocket(), this._backoff);
+                this._backoff = Math.min(this._backoff * 2, 3000);
+            }
+
             updateConnectionStatus(connected) {
-                const statusEl = document.getElementById('connectionStatus');
-                const debugEl = document.getElementById('debugWebSocket');
+                const statusEl = this.el.status;
+                const debugEl = this.el.wsDbg;
                 if (connected) {
                     statusEl.textContent = '🟢 Connected';
                     statusEl.className = 'connection-status connected';
@@ -509,7 +719,7 @@ def create_html_file():
 
             // FIXED: New steering wheel logic that prevents angle wraparound
             setupSteeringWheel() {
-                const wheel = document.getElementById('steeringWheel');
+                const wheel = this.el.wheel;
                 let isDragging = false;
 
                 const getAngle = (event) => {
@@ -533,7 +743,7 @@ def create_html_file():
                 const startDrag = (event) => {
                     event.preventDefault();
                     if (this.steeringAnimation) {
-                        clearInterval(this.steeringAnimation);
+                        cancelAnimationFrame(this.steeringAnimation);
                         this.steeringAnimation = null;
                     }
                     isDragging = true;
@@ -557,6 +767,7 @@ def create_html_file():
                     
                     this.lastTouchAngle = currentAngle;
                     this.updateSteering();
+                    this.scheduleSend();
                 };
 
                 const stopDrag = () => {
@@ -564,19 +775,24 @@ def create_html_file():
                     isDragging = false;
                     this.lastTouchAngle = null;
                     
-                    // Auto-return to center
-                    if (this.steeringAnimation) clearInterval(this.steeringAnimation);
-                    this.steeringAnimation = setInterval(() => {
+                    // Auto-return to center, one step per display frame
+                    if (this.steeringAnimation) cancelAnimationFrame(this.steeringAnimation);
+                    const tick = () => {
                         const step = this.cumulativeAngle * 0.15;
                         this.cumulativeAngle -= step;
 
                         if (Math.abs(this.cumulativeAngle) < 0.5) {
                             this.cumulativeAngle = 0;
-                            clearInterval(this.steeringAnimation);
                             this.steeringAnimation = null;
+                            this.updateSteering();
+                            this.scheduleSend();
+                            return;
                         }
                         this.updateSteering();
-                    }, 16); // 60 FPS
+                        this.scheduleSend();
+                        this.steeringAnimation = requestAnimationFrame(tick);
+                    };
+                    this.steeringAnimation = requestAnimationFrame(tick);
                 };
 
                 wheel.addEventListener('mousedown', startDrag);
@@ -605,6 +821,7 @@ def create_html_file():
                     else if (type === 'brake') this.brakeValue = percentage;
                     
                     this.updateUI();
+                    this.scheduleSend();
                 };
 
                 const startDrag = (event) => { event.preventDefault(); isDragging = true; updatePedal(event); this.vibrate(); };
@@ -625,9 +842,9 @@ def create_html_file():
                 const hornBtn = document.getElementById('hornBtn');
                 const fullscreenBtn = document.getElementById('fullscreenBtn');
 
-                const handleButton = (btn, command) => {
-                    const down = () => { btn.style.transform = 'scale(0.95)'; this.sendCommand(`${command}_press`); this.vibrate(); };
-                    const up = () => { btn.style.transform = ''; this.sendCommand(`${command}_release`); };
+                const handleButton = (btn, command, flag) => {
+                    const down = () => { btn.style.transform = 'scale(0.95)'; this.buttonFlags |= flag; this.sendCommand(`${command}_press`); this.vibrate(); };
+                    const up = () => { btn.style.transform = ''; this.buttonFlags &= ~flag; this.sendCommand(`${command}_release`); };
                     btn.addEventListener('mousedown', down);
                     btn.addEventListener('mouseup', up);
                     btn.addEventListener('mouseleave', up);
@@ -635,14 +852,19 @@ def create_html_file():
                     btn.addEventListener('touchend', up);
                 };
 
-                handleButton(handbrakeBtn, 'handbrake');
-                handleButton(hornBtn, 'horn');
+                handleButton(handbrakeBtn, 'handbrake', FLAG_HANDBRAKE);
+                handleButton(hornBtn, 'horn', FLAG_HORN);
 
                 resetBtn.addEventListener('click', () => {
+                    if (this.steeringAnimation) {
+                        cancelAnimationFrame(this.steeringAnimation);
+                        this.steeringAnimation = null;
+                    }
                     this.cumulativeAngle = 0;
                     this.acceleratorValue = 0;
                     this.brakeValue = 0;
                     this.updateUI();
+                    this._prev.fill(0);
                     this.sendCommand('reset');
                     this.vibrate();
                 });
@@ -669,53 +891,114 @@ def create_html_file():
             }
 
             updateSteering() {
-                document.getElementById('steeringWheel').style.transform = `rotate(${this.cumulativeAngle}deg)`;
-                document.getElementById('steeringValue').textContent = `${Math.round(this.cumulativeAngle)}°`;
-                document.getElementById('debugSteering').textContent = `${Math.round(this.cumulativeAngle)}° / ±${this.maxRotation}°`;
+                this.el.wheel.style.transform = `rotate(${this.cumulativeAngle}deg)`;
+                const r = Math.round(this.cumulativeAngle);
+                if (r === this._lastSteerInt) return;
+                this._lastSteerInt = r;
+                this.el.sVal.textContent = `${r}°`;
+                this.el.sDbg.textContent = `${r}° / ±${this.maxRotation}°`;
             }
 
             updateAccelerator() {
-                document.getElementById('acceleratorFill').style.width = `${this.acceleratorValue}%`;
-                document.getElementById('acceleratorValue').textContent = `${Math.round(this.acceleratorValue)}%`;
-                document.getElementById('debugAccelerator').textContent = `${Math.round(this.acceleratorValue)}%`;
+                this.el.aFill.style.width = `${this.acceleratorValue}%`;
+                const r = Math.round(this.acceleratorValue);
+                if (r === this._lastAccInt) return;
+                this._lastAccInt = r;
+                this.el.aVal.textContent = this.el.aDbg.textContent = `${r}%`;
             }
 
             updateBrake() {
-                document.getElementById('brakeFill').style.width = `${this.brakeValue}%`;
-                document.getElementById('brakeValue').textContent = `${Math.round(this.brakeValue)}%`;
-                document.getElementById('debugBrake').textContent = `${Math.round(this.brakeValue)}%`;
+                this.el.bFill.style.width = `${this.brakeValue}%`;
+                const r = Math.round(this.brakeValue);
+                if (r === this._lastBrkInt) return;
+                this._lastBrkInt = r;
+                this.el.bVal.textContent = this.el.bDbg.textContent = `${r}%`;
             }
 
             sendCommand(command, data = {}) {
                 if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-                    try {
-                        this.ws.send(JSON.stringify({ command, data, timestamp: Date.now() }));
-                    } catch (error) {
-                        console.error('Error sending command:', error);
+                    const dv = new DataView(new ArrayBuffer(RECORD_SIZE));
+                    dv.setUint8(0, COMMAND_CODES[command]);
+                    dv.setUint8(1, this.buttonFlags);
+                    dv.setFloat32(4, data.steering || 0, true);
+                    dv.setFloat32(8, data.accelerator || 0, true);
+                    dv.setFloat32(12, data.brake || 0, true);
+                    this._outbox.push(dv.buffer);
+                    this.requestFlush();
+                }
+            }
+
+            // Send everything queued during this display frame as one WebSocket frame
+            flushOutbox() {
+                const count = this._outbox.length;
+                if (!count) return;
+                try {
+                    if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+                        if (count === 1) {
+                            this.ws.send(this._outbox[0]);
+                        } else {
+                            const batch = new Uint8Array(count * RECORD_SIZE);
+                            this._outbox.forEach((record, i) => batch.set(new Uint8Array(record), i * RECORD_SIZE));
+                            this.ws.send(batch.buffer);
+                        }
                     }
+                } catch (error) {
+                    console.error('Error sending command:', error);
                 }
+                this._outbox.length = 0;
             }
 
-            // CHANGED: Update rate increased to 60 FPS (16.67ms)
-            startUpdateLoop() {
-                let lastSent = { steering: 0, accelerator: 0, brake: 0 };
+            requestFlush() {
+                if (this._rafHandle) return;
+                this._rafHandle = requestAnimationFrame(() => {
+                    if (this._dirty) {
+                        this._dirty = false;
+                        this.maybeSendUpdate();
+                    }
+                    this.flushOutbox();
+                    this._rafHandle = 0;
+                });
+            }
 
-                setInterval(() => {
-                    const currentState = {
-                        steering: this.cumulativeAngle, // Send full rotation value
-                        accelerator: this.acceleratorValue,
-                        brake: this.brakeValue
-                    };
+            // Coalesce all input events within one display frame into a single update
+            scheduleSend() {
+                this._dirty = true;
+                this.requestFlush();
+            }
 
-                    const hasChanged = Math.abs(currentState.steering - lastSent.steering) > 0.1 ||
-                                       Math.abs(currentState.accelerator - lastSent.accelerator) > 0.1 ||
-                                       Math.abs(currentState.brake - lastSent.brake) > 0.1;
+            // Only send when a value moved by at least one step of the controller axis it drives
+            maybeSendUpdate() {
+                const cur = this._cur, prev = this._prev, thresh = this._thresh;
+                cur[0] = this.cumulativeAngle;
+                cur[1] = this.acceleratorValue;
+                cur[2] = this.brakeValue;
+                let changed = this._force;
+                for (let i = 0; i < 3 && !changed; i++) changed = Math.abs(cur[i] - prev[i]) >= thresh[i];
+                if (!changed) return;
+                if (!this.ws || this.ws.readyState !== WebSocket.OPEN) return;
+
+                prev.set(cur);
+                this._force = false;
+                this.sendCommand('update', {
+                    steering: cur[0], // Send full rotation value
+                    accelerator: cur[1],
+                    brake: cur[2]
+                });
+            }
 
-                    if (hasChanged) {
-                        this.sendCommand('update', currentState);
-                        lastSent = currentState;
-                    }
-                }, 50); // CHANGED: 60 FPS (was 50ms/20fps)
+            // True while this client holds any input away from neutral
+            isActive() {
+                return this.cumulativeAngle !== 0 || this.acceleratorValue !== 0 || this.brakeValue !== 0 || this.buttonFlags !== 0;
+            }
+
+            // Resend the current state periodically so a dropped update cannot leave the server stale.
+            // An idle client stays quiet, or its neutral state would override another phone's input
+            startHeartbeat() {
+                setInterval(() => {
+                    if (!this.isActive()) return;
+                    this._force = true;
+                    this.scheduleSend();
+                }, HEARTBEAT_MS);
             }
         }
 
@@ -727,30 +1010,26 @@ def create_html_file():
     
     return html_content
 
+# The page never changes while the server runs, so render and compress it once
+_HTML_BYTES = _build_html().encode('utf-8')
+_HTML_GZ = gzip.compress(_HTML_BYTES, compresslevel=9)
+
+# Capabilities are fixed once the imports above have run, so the banner is built once here
+_DEPS_BANNER = "\n".join(["📦 LIBRARIES:"] + [f"   ✅ {lib}" for available, lib in (
+    (VGAMEPAD_AVAILABLE, "vgamepad - Xbox controller emulation"),
+    (VJOY_AVAILABLE, "PyVJoy - VJoy joystick emulation"),
+    (PYAUTOGUI_AVAILABLE, "PyAutoGUI - Keyboard fallback"),
+    (PYDIRECTINPUT_AVAILABLE, "PyDirectInput - Scancode keyboard fallback"),
+    (ORJSON_AVAILABLE, "orjson - Fast message decoding"),
+    (UVLOOP_AVAILABLE, "uvloop - Fast event loop"),
+    (WEBSOCKETS_OK, "WebSockets - Communication"),
+) if available])
+
 def check_dependencies():
-    libraries_found = []
-    
-    if VGAMEPAD_AVAILABLE:
-        libraries_found.append("✅ vgamepad - Xbox controller emulation")
-    
-    if VJOY_AVAILABLE:
-        libraries_found.append("✅ PyVJoy - VJoy joystick emulation")
-    
-    if PYAUTOGUI_AVAILABLE:
-        libraries_found.append("✅ PyAutoGUI - Keyboard fallback")
-    
-    try:
-        import websockets
-        libraries_found.append("✅ WebSockets - Communication")
-    except ImportError:
-        print("❌ WebSockets not found - Install: pip install websockets")
+    if not WEBSOCKETS_OK:
+        print(f"❌ WebSockets {websockets.__version__} is too old - Install: pip install \"websockets>=14\"")
         return False
-    
-    if libraries_found:
-        print("📦 LIBRARIES:")
-        for lib in libraries_found:
-            print(f"   {lib}")
-    
+    print(_DEPS_BANNER)
     return True
 
 def main():
@@ -760,24 +1039,15 @@ def main():
     if not check_dependencies():
         return
     
-    try:
-        html_content = create_html_file()
-        with open('index.html', 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print("✅ index.html created")
-    except Exception as e:
-        print(f"⚠️ Could not create index.html: {e}")
-    
-    try:
-        create_html_server()
-        time.sleep(1)
-    except Exception as e:
-        print(f"⚠️ HTTP server error: {e}")
+    print(f"✅ Web interface served from memory ({len(_HTML_GZ)} bytes gzipped)")
     
-    server = AnalogRacingServer()
+    server = AnalogRacingServer(unix_path=os.environ.get('RACING_UNIX_SOCKET'))
     
     try:
-        asyncio.run(server.start_server())
+        # uvloop.run() creates its own loop; uvloop.install() is deprecated on Python 3.12+.
+        # uvloop.run() only exists from 0.18, older releases fall back to the default loop
+        run = (getattr(uvloop, 'run', None) if UVLOOP_AVAILABLE else None) or asyncio.run
+        run(server.start_server())
     except KeyboardInterrupt:
         print("\n\n👋 Server stopped")
     except Exception as e: